@@ -90,13 +90,13 @@ class CaseComparison:
 
     @property
     def finite_difference_speedup(self) -> float:
-        """Return SciPy/finite-difference median runtime [-]."""
-        return self.scipy_wall_median_s / self.finite_difference_wall_median_s
+        """Return SciPy/finite-difference median runtime [-], or NaN if unmeasured."""
+        return _runtime_ratio(self.scipy_wall_median_s, self.finite_difference_wall_median_s)
 
     @property
     def collocation_speedup(self) -> float:
-        """Return SciPy/collocation median runtime [-]."""
-        return self.scipy_wall_median_s / self.collocation_wall_median_s
+        """Return SciPy/collocation median runtime [-], or NaN if unmeasured."""
+        return _runtime_ratio(self.scipy_wall_median_s, self.collocation_wall_median_s)
 
     @property
     def finite_difference_objective_gap_percent(self) -> float:
@@ -117,6 +117,18 @@ class CaseComparison:
         )
 
 
+def _runtime_ratio(reference_s: float, candidate_s: float) -> float:
+    """Return ``reference_s / candidate_s`` [-], NaN unless both times are positive.
+
+    A zero wall time means the clock did not resolve the run, so there is no
+    meaningful ratio to report; NaN keeps such rows visible in tables instead
+    of raising mid-sweep or printing ``inf``.
+    """
+    if not (reference_s > 0.0 and candidate_s > 0.0):
+        return float("nan")
+    return reference_s / candidate_s
+
+
 ScipyRunner = Callable[..., SolverRun]
 DaeRunner = Callable[..., SolverRun]
 SensitivityRowValues = Callable[[SolverRun], Mapping[str, Any]]
@@ -369,43 +381,37 @@ def legacy_equality_residuals(
     vial, product, ht = data["vial"], data["product"], data["ht"]
     lpr0_cm = functions.Lpr0_FUN(vial["Vfill"], vial["Ap"], product["cSolid"])
 
-    residuals: list[Tuple[float, ...]] = []
-    scales: list[Tuple[float, ...]] = []
-    for row in table:
-        pressure_torr = row[4] / constant.Torr_to_mTorr
-        rate_kg_per_hr = row[5] * vial["Ap"] * constant.cm_To_m**2
-        cake_length_cm = row[6] / 100.0 * lpr0_cm
-        front_pressure_torr = functions.Vapor_pressure(row[1])
-        kv = functions.Kv_FUN(ht["KC"], ht["KP"], ht["KD"], pressure_torr)
-        rp = functions.Rp_FUN(cake_length_cm, product["R0"], product["A1"], product["A2"])
-        residuals.append(
-            functions.Eq_Constraints(
-                pressure_torr,
-                rate_kg_per_hr,
-                row[2],
-                row[3],
-                front_pressure_torr,
-                row[1],
-                kv,
-                lpr0_cm,
-                cake_length_cm,
-                vial["Av"],
-                vial["Ap"],
-                rp,
-            )
-        )
-        # One representative magnitude per equation, taken from the same row.
-        scales.append(
-            (
-                abs(front_pressure_torr),
-                abs(rate_kg_per_hr),
-                abs(vial["Ap"] * (row[2] - row[1]) * constant.k_ice),
-                abs(row[3] - row[2]),
-            )
-        )
+    # Every legacy helper is elementwise, so evaluate whole columns at once.
+    pressure_torr = table[:, 4] / constant.Torr_to_mTorr
+    rate_kg_per_hr = table[:, 5] * vial["Ap"] * constant.cm_To_m**2
+    cake_length_cm = table[:, 6] / 100.0 * lpr0_cm
+    front_pressure_torr = functions.Vapor_pressure(table[:, 1])
+    kv = functions.Kv_FUN(ht["KC"], ht["KP"], ht["KD"], pressure_torr)
+    rp = functions.Rp_FUN(cake_length_cm, product["R0"], product["A1"], product["A2"])
+    residuals = functions.Eq_Constraints(
+        pressure_torr,
+        rate_kg_per_hr,
+        table[:, 2],
+        table[:, 3],
+        front_pressure_torr,
+        table[:, 1],
+        kv,
+        lpr0_cm,
+        cake_length_cm,
+        vial["Av"],
+        vial["Ap"],
+        rp,
+    )
+    # One representative magnitude per equation, taken from the same row.
+    scales = (
+        front_pressure_torr,
+        rate_kg_per_hr,
+        vial["Ap"] * (table[:, 2] - table[:, 1]) * constant.k_ice,
+        table[:, 3] - table[:, 2],
+    )
 
-    absolute = np.abs(np.asarray(residuals, dtype=float))
-    magnitude = np.abs(np.asarray(scales, dtype=float))
+    absolute = np.abs(np.column_stack(residuals))
+    magnitude = np.abs(np.column_stack(scales))
 
     # Normalize by the largest magnitude each equation reaches anywhere on the
     # trajectory, not row by row. Several of these terms legitimately vanish at
@@ -148,6 +148,15 @@ def run_pyomo_dae(
     return solver_run_from_dae_result(result, wall_time_s=wall_time_s)
 
 
+def _reusable_solver(solver: Union[str, Any]) -> Any:
+    """Return one solver object to share across a sequence of DAE solves."""
+    if not isinstance(solver, str):
+        return solver
+    from pyomo.environ import SolverFactory  # type: ignore[import-untyped]
+
+    return SolverFactory(solver)
+
+
 def _require_successful_run(run: SolverRun, label: str) -> None:
     if not run.success:
         raise RuntimeError(f"{label} failed: {run.solver_status}/{run.termination_condition}")
@@ -226,6 +235,7 @@ def run_implementability_analysis(
     pressure_ramp_rate_torr_hr: float = 0.05,
     shelf_temperature_ramp_rate_c_hr: float = 30.0,
     solver: Union[str, Any] = "ipopt",
+    seed_from_idealized: bool = False,
 ) -> ImplementabilityAnalysis:
     """Solve and decompose one implementable-cycle time penalty.
 
@@ -251,6 +261,11 @@ def run_implementability_analysis(
         Maximum adjacent-node shelf-temperature rate [degC/hr].
     solver
         Pyomo solver name or solver object [-].
+    seed_from_idealized
+        Initialize the three anchored or rate-limited cycles from the
+        idealized trajectory instead of the cold default start [-]. Off by
+        default because a different start can reach a different local
+        optimum and change the reported penalty decomposition.
 
     Returns
     -------
@@ -264,10 +279,14 @@ def run_implementability_analysis(
         "nfe": collocation_nfe,
         "ncp": ncp,
         "final_dried_fraction": final_dried_fraction,
-        "solver": solver,
+        "solver": _reusable_solver(solver),
     }
     idealized = run_pyomo_dae(a1, kc, **common)
     _require_successful_run(idealized, "rate-unlimited idealized cycle")
+    if seed_from_idealized:
+        # The remaining cycles only add anchors and rate limits to the same
+        # transcription, so the idealized optimum is a feasible-shaped start.
+        common["initialize"] = idealized.trajectory
 
     anchored_unlimited = run_pyomo_dae(
         a1,
@@ -326,12 +345,19 @@ def run_slew_rate_sweep(
     initial_pressure_torr: float = 0.15,
     initial_shelf_temperature_c: float = 30.0,
     solver: Union[str, Any] = "ipopt",
+    seed_from_neighbours: bool = False,
 ) -> list[dict[str, float]]:
     """Return implementable-cycle time penalties over actuator-rate pairs.
 
     Each row contains the pressure rate [Torr/hr], shelf-temperature rate
     [degC/hr], optimized completion time [hr], and its increase over the
     supplied idealized reference [hr and %].
+
+    By default every pair is solved from the cold default start, in the
+    order given. With ``seed_from_neighbours`` both rate lists are solved in
+    ascending order, and each solve is initialized from the solved pair
+    with the next-lower shelf rate. The first solve at each pressure rate
+    starts from the first solve at the next-lower pressure rate.
     """
     if not np.isfinite(idealized_time_hr) or idealized_time_hr <= 0.0:
         raise ValueError("idealized_time_hr must be finite and positive")
@@ -347,9 +373,15 @@ def run_slew_rate_sweep(
         raise ValueError("shelf_temperature_ramp_rates_c_hr must contain positive values")
 
     _, collocation_nfe = matched_nfe_for_point_budget(point_budget, ncp)
+    solver = _reusable_solver(solver)
+    if seed_from_neighbours:
+        pressure_rates = tuple(sorted(pressure_rates))
+        shelf_rates = tuple(sorted(shelf_rates))
     rows: list[dict[str, float]] = []
+    row_seed: np.ndarray | None = None
     for pressure_rate in pressure_rates:
-        for shelf_rate in shelf_rates:
+        seed = row_seed
+        for column, shelf_rate in enumerate(shelf_rates):
             run = run_pyomo_dae(
                 a1,
                 kc,
@@ -361,6 +393,7 @@ def run_slew_rate_sweep(
                 initial_shelf_temperature=initial_shelf_temperature_c,
                 pressure_ramp_rate=pressure_rate,
                 shelf_temperature_ramp_rate=shelf_rate,
+                initialize=seed,
                 solver=solver,
             )
             _require_successful_run(
@@ -368,6 +401,10 @@ def run_slew_rate_sweep(
                 f"slew sweep P={pressure_rate:g} Torr/hr, "
                 f"Tsh={shelf_rate:g} degC/hr",
             )
+            if seed_from_neighbours:
+                if column == 0:
+                    row_seed = run.trajectory
+                seed = run.trajectory
             penalty_hr = run.objective_time_hr - idealized_time_hr  # [hr]
             rows.append(
                 {
@@ -16,8 +16,6 @@ import csv
 import time
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-
 if __package__:
     from .original_workflow_parity import (
         ResistanceFit,
@@ -87,6 +85,8 @@ def save_plot(
     output_dir: Path = OUTPUT_DIR,
 ) -> Path:
     """Plot measured/replayed temperature, resistance, flux, and drying progress."""
+    import matplotlib.pyplot as plt
+
     output_dir.mkdir(exist_ok=True)
     figure, axes = plt.subplots(2, 2, figsize=(12, 9))
     axes[0, 0].plot(time_exp, tbot_exp, "k.", label="Measured")
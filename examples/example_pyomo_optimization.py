@@ -105,14 +105,16 @@ def run_pyomo_optimization_example() -> dict[str, Mapping[str, Any]]:
 
 
 def _print_summary(summary: Mapping[str, Mapping[str, Any]]) -> None:
+    lines = []
     for mode, values in summary.items():
         optimized = ", ".join(values["optimized_controls"]) or "none"
         fixed = ", ".join(values["fixed_controls"]) or "none"
-        print(
+        lines.append(
             f"{mode}: optimized={optimized}; fixed={fixed}; "
             f"time_nodes={values['time_nodes']}; variables={values['variables']}; "
             f"constraints={values['constraints']}"
         )
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
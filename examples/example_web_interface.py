@@ -22,7 +22,6 @@ Based on the web interface inputs from the screenshot:
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
 
 if __package__:
     from .original_workflow_parity import known_rp_case, run_known_rp_scipy
@@ -174,6 +173,8 @@ def plot_results(output, save_fig=True):
         output (np.ndarray): Simulation output array
         save_fig (bool): Whether to save figure to file
     """
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(2, 3, figsize=(15, 8))
     fig.suptitle('LyoPRONTO Primary Drying Simulation Results', fontsize=14, fontweight='bold')
     
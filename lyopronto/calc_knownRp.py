@@ -70,6 +70,10 @@ def dry(vial,product,ht,Pchamber,Tshelf,dt):
     Lck0 = [0.0]
     T0 = Tsh_t(0)
 
+    # Cake length gained per unit of sublimated mass; constant over the run,
+    # so it is computed once instead of in every right-hand-side evaluation
+    dL_dm = constant.kg_To_g/(1-product['cSolid']*constant.rho_solution/constant.rho_solute)/(vial['Ap']*constant.rho_ice)*(1-product['cSolid']*(constant.rho_solution-constant.rho_ice)/constant.rho_solute) # [cm/kg]
+
     ################ Set up dynamic equation ######################
     # This function is defined here because it uses local variables, rather than
     # taking them as arguments.
@@ -88,7 +92,7 @@ def dry(vial,product,ht,Pchamber,Tshelf,dt):
             return [dLdt]
         # Tbot = functions.T_bot_FUN(Tsub,Lpr0,Lck,Pch,Rp)    # Vial bottom temperature array in degC
 
-        dLdt = (dmdt*constant.kg_To_g)/(1-product['cSolid']*constant.rho_solution/constant.rho_solute)/(vial['Ap']*constant.rho_ice)*(1-product['cSolid']*(constant.rho_solution-constant.rho_ice)/constant.rho_solute) # [cm/hr]
+        dLdt = dmdt*dL_dm # [cm/hr]
         return [dLdt]
 
     ### ------ Condition for ending simulation: completed drying
@@ -155,31 +155,35 @@ def _warmstart_from_legacy_table(
     normalized_source_time = table[:, 0] / horizon
     ap = float(pyo.value(model.Ap))
     lpr0 = float(pyo.value(model.Lpr0))
-    for tau in model.t:
-        coordinate = float(tau)
-        model.Lck[tau].set_value(
-            np.interp(coordinate, normalized_source_time, table[:, 6]) / 100.0 * lpr0
-        )
-        model.Tsub[tau].set_value(np.interp(coordinate, normalized_source_time, table[:, 1]))
-        model.Tbot[tau].set_value(np.interp(coordinate, normalized_source_time, table[:, 2]))
-        model.Tsh[tau].set_value(np.interp(coordinate, normalized_source_time, table[:, 3]))
-        model.Pch[tau].set_value(
-            np.interp(coordinate, normalized_source_time, table[:, 4]) / constant.Torr_to_mTorr
-        )
-        dmdt = np.interp(coordinate, normalized_source_time, table[:, 5]) * ap * constant.cm_To_m**2
-        model.dmdt[tau].set_value(dmdt)
-        psub = float(functions.Vapor_pressure(pyo.value(model.Tsub[tau])))
-        model.Psub[tau].set_value(psub)
-        model.log_Psub[tau].set_value(np.log(psub))
-        model.Kv[tau].set_value(
-            functions.Kv_FUN(
-                pyo.value(model.KC),
-                pyo.value(model.KP),
-                pyo.value(model.KD),
-                pyo.value(model.Pch[tau]),
-            )
-        )
-        model.dLck_dt[tau].set_value(horizon * dmdt * float(pyo.value(model.drying_length_factor)))
+    points = list(model.t)
+    coordinates = np.asarray([float(tau) for tau in points], dtype=float)
+
+    # Interpolate each legacy column over the whole mesh at once; the
+    # functions helpers are elementwise, so the derived states follow suit.
+    def column(index: int) -> np.ndarray:
+        return np.interp(coordinates, normalized_source_time, table[:, index])
+
+    tsub = column(1)
+    pch = column(4) / constant.Torr_to_mTorr
+    dmdt = column(5) * ap * constant.cm_To_m**2
+    psub = functions.Vapor_pressure(tsub)
+    kv = functions.Kv_FUN(pyo.value(model.KC), pyo.value(model.KP), pyo.value(model.KD), pch)
+    length_rate = horizon * dmdt * float(pyo.value(model.drying_length_factor))
+    series = (
+        (model.Lck, column(6) / 100.0 * lpr0),
+        (model.Tsub, tsub),
+        (model.Tbot, column(2)),
+        (model.Tsh, column(3)),
+        (model.Pch, pch),
+        (model.dmdt, dmdt),
+        (model.Psub, psub),
+        (model.log_Psub, np.log(psub)),
+        (model.Kv, kv),
+        (model.dLck_dt, length_rate),
+    )
+    for component, values in series:
+        for tau, value in zip(points, values.tolist()):
+            component[tau].set_value(value)
 
 
 def _create_dae_optimization_model(
@@ -425,7 +429,7 @@ def _create_dae_optimization_model(
             scheme="LAGRANGE-RADAU",
         )
 
-    points = sorted(model.t)
+    points = list(model.t)
     if pressure_ramp_rate is not None:
         pressure_rate = float(pressure_ramp_rate)  # [Torr/hr]
         model.chamber_pressure_ramp_up = pyo.ConstraintList()
@@ -500,17 +504,21 @@ def _create_dae_optimization_model(
     model.ipopt_zU_out = pyo.Suffix(direction=pyo.Suffix.IMPORT)
     model.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
     model.scaling_factor[model.t_final] = 0.1
+    # Suffix.set_value expands an indexed Var to every time point in one call.
+    for component, factor in (
+        (model.Lck, 1.0 / lpr0),
+        (model.Tsub, 0.1),
+        (model.Tbot, 0.1),
+        (model.Psub, 5.0),
+        (model.dmdt, 1.0e4),
+        (model.Kv, 1.0e4),
+    ):
+        model.scaling_factor.set_value(component, factor)
     for tau in model.t:
-        model.scaling_factor[model.Lck[tau]] = 1.0 / lpr0
-        model.scaling_factor[model.Tsub[tau]] = 0.1
-        model.scaling_factor[model.Tbot[tau]] = 0.1
         if not model.Tsh[tau].fixed:
             model.scaling_factor[model.Tsh[tau]] = 0.05
         if not model.Pch[tau].fixed:
             model.scaling_factor[model.Pch[tau]] = 5.0
-        model.scaling_factor[model.Psub[tau]] = 5.0
-        model.scaling_factor[model.dmdt[tau]] = 1.0e4
-        model.scaling_factor[model.Kv[tau]] = 1.0e4
     return model
 
 
@@ -664,7 +672,7 @@ def create_dae_joint_optimization_model(
 
 def dae_optimization_values(model: pyo.ConcreteModel) -> dict[str, np.ndarray]:
     """Extract a solved normalized-time DAE model into physical-time arrays."""
-    coordinates = sorted(model.t)
+    coordinates = list(model.t)
     final_time = pyo.value(model.t_final, exception=False)
     scale = np.nan if final_time is None else float(final_time)
     values: dict[str, np.ndarray] = {
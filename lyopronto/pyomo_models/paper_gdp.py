@@ -706,7 +706,7 @@ def extract_paper_gdp_solution(
     for phase_index in model.phases:
         phase = model.phase[phase_index]
         duration_s = float(pyo.value(phase.duration_s))
-        local_points = sorted(float(tau) for tau in phase.t)
+        local_points = [float(tau) for tau in phase.t]
         phase_start_s = elapsed_s
         phase_end_s = phase_start_s + duration_s
         phase_rows.append(
@@ -720,7 +720,7 @@ def extract_paper_gdp_solution(
         )
         if phase_index > 1:
             previous = model.phase[phase_index - 1]
-            previous_interior = sorted(float(tau) for tau in previous.t)[-2]
+            previous_interior = float(previous.t.at(-2))
             next_interior = local_points[1]
             switch_intervals_hr.append(
                 (
@@ -776,7 +776,7 @@ def initialize_paper_problem_from_trajectory(
         else np.gradient(interface_position, time_s, edge_order=1)
     )
 
-    for tau in sorted(model.t):
+    for tau in model.t:
         absolute_time = float(tau) * final_time
         interface_value = float(np.interp(absolute_time, time_s, interface_position))
         shelf_value = float(np.interp(absolute_time, time_s, shelf_temperature))
@@ -1390,7 +1390,7 @@ def _initialize_problem1_model(model: Any) -> None:
     time_guess = settings.time_guess
     model.t_final.set_value(time_guess)
 
-    for t in sorted(model.t):
+    for t in model.t:
         tau = float(t)
         s_guess = terminal_s * tau
         model.S[t].set_value(s_guess)
@@ -1432,11 +1432,9 @@ def _add_problem1_scaling(model: Any) -> None:
 
     model.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
     model.scaling_factor[model.t_final] = 1.0e-4
-    for t in model.t:
-        model.scaling_factor[model.S[t]] = 1.0e2
-        model.scaling_factor[model.Tb[t]] = 1.0e-2
-        for i in model.z:
-            model.scaling_factor[model.T[i, t]] = 1.0e-2
+    model.scaling_factor.set_value(model.S, 1.0e2)
+    model.scaling_factor.set_value(model.Tb, 1.0e-2)
+    model.scaling_factor.set_value(model.T, 1.0e-2)
 
     _set_component_scaling(model, "interface_ode", 1.0e2)
     _set_component_scaling(model, "temperature_ode", 1.0e-2)
@@ -1453,12 +1451,7 @@ def _add_problem1_scaling(model: Any) -> None:
 def _set_component_scaling(model: Any, component_name: str, factor: float) -> None:
     if not hasattr(model, component_name):
         return
-    component = getattr(model, component_name)
-    if component.is_indexed():
-        for index in component:
-            model.scaling_factor[component[index]] = factor
-    else:
-        model.scaling_factor[component] = factor
+    model.scaling_factor.set_value(getattr(model, component_name), factor)
 
 
 def _numeric_temperature_rhs(
@@ -1835,7 +1828,7 @@ def extract_paper_solution(model: Any, results: Any | None = None) -> dict[str,
     discretization = model._paper_discretization
     derived = model._paper_derived
     settings = model._paper_problem_settings
-    t_points = sorted(model.t)
+    t_points = list(model.t)
     z_points = list(model.z)
     t_final = float(pyo.value(model.t_final))
     tau = np.array([float(t) for t in t_points])
@@ -200,7 +200,7 @@ def apply_trajectory_warmstart(
 def sample_ramp_profile(rampspec: Mapping[str, Any], time_points: Sequence[float]) -> np.ndarray:
     """Sample a legacy ramp specification at trajectory node times."""
     ramp = functions.RampInterpolator(rampspec)
-    return np.array([float(ramp(float(time))) for time in time_points], dtype=float)
+    return np.asarray(ramp(np.asarray(time_points, dtype=float)), dtype=float)
 
 
 def trajectory_initialization_from_scipy_output(
@@ -243,8 +243,7 @@ def trajectory_initialization_from_scipy_output(
     }
     if ht is not None:
         initialization["Kv"] = np.asarray(
-            [functions.Kv_FUN(ht["KC"], ht["KP"], ht["KD"], pressure) for pressure in pch],
-            dtype=float,
+            functions.Kv_FUN(ht["KC"], ht["KP"], ht["KD"], pch), dtype=float
         )
     return initialization
 
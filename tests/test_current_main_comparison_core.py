@@ -127,6 +127,38 @@ def test_collect_case_comparison_owns_repeats_warmstarts_and_aggregation() -> No
     assert comparison.collocation_wall_times_s == (2.0, 4.0)
     assert comparison.finite_difference_objective_gap_percent == 5.0
     assert comparison.collocation_objective_gap_percent == pytest.approx(1.0)
+    assert comparison.finite_difference_speedup == pytest.approx(1.5 / 2.0)
+    assert comparison.collocation_speedup == pytest.approx(1.5 / 3.0)
+
+
+def test_case_comparison_speedup_is_nan_for_unresolved_wall_time() -> None:
+    """A zero median wall time yields NaN instead of dividing by zero."""
+    trajectory = _trajectory(10.0)
+    comparison = CaseComparison(
+        a1=16.0,
+        kc=2.75e-4,
+        scipy_trajectory=trajectory,
+        finite_difference_trajectory=trajectory,
+        collocation_trajectory=trajectory,
+        scipy_wall_times_s=(1.0,),
+        finite_difference_wall_times_s=(0.0,),
+        collocation_wall_times_s=(0.5,),
+        finite_difference_status="ok",
+        finite_difference_termination="optimal",
+        collocation_status="ok",
+        collocation_termination="optimal",
+        finite_difference_max_constraint_violation=0.0,
+        collocation_max_constraint_violation=0.0,
+        finite_difference_n_variables=20,
+        finite_difference_n_constraints=10,
+        finite_difference_solver_iterations=4,
+        collocation_n_variables=20,
+        collocation_n_constraints=10,
+        collocation_solver_iterations=4,
+    )
+
+    assert np.isnan(comparison.finite_difference_speedup)
+    assert comparison.collocation_speedup == pytest.approx(2.0)
 
 
 def test_collect_case_comparison_rejects_failure_before_running_dae() -> None:
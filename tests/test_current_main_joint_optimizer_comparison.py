@@ -5,6 +5,7 @@ import pytest
 
 from examples.current_main_joint_optimizer_comparison import (
     ImplementabilityAnalysis,
+    SolverRun,
     run_implementability_analysis,
     run_slew_rate_sweep,
     comparison_inputs,
@@ -16,6 +17,23 @@ from examples.current_main_joint_optimizer_comparison import (
 from tests.pyomo_solver import require_pyomo_solver
 
 
+def _joint_solver_run(trajectory: np.ndarray, objective_time_hr: float) -> SolverRun:
+    """Return a successful normalized run with the given final time [hr]."""
+    return SolverRun(
+        trajectory=trajectory,
+        wall_time_s=0.0,
+        objective_time_hr=objective_time_hr,
+        success=True,
+        solver_status="ok",
+        termination_condition="optimal",
+        max_constraint_violation=0.0,
+        n_time_points=len(trajectory),
+        n_variables=1,
+        n_constraints=1,
+        solver_iterations=1,
+    )
+
+
 def test_joint_comparison_inputs_match_paper_mannitol_joint_case() -> None:
     data = comparison_inputs(18.0, 3.3e-4)
 
@@ -158,22 +176,9 @@ def test_current_main_joint_comparison_notebook_execution(repo_root) -> None:
 
 def test_implementability_penalty_decomposition_is_additive() -> None:
     """Anchoring and slew increments sum to the total drying-time penalty [hr]."""
-    from examples.current_main_comparison import SolverRun
 
     def run(objective_time_hr: float) -> SolverRun:
-        return SolverRun(
-            trajectory=np.zeros((2, 7)),
-            wall_time_s=0.0,
-            objective_time_hr=objective_time_hr,
-            success=True,
-            solver_status="ok",
-            termination_condition="optimal",
-            max_constraint_violation=0.0,
-            n_time_points=2,
-            n_variables=1,
-            n_constraints=1,
-            solver_iterations=1,
-        )
+        return _joint_solver_run(np.zeros((2, 7)), objective_time_hr)
 
     analysis = ImplementabilityAnalysis(
         idealized=run(10.0),
@@ -196,6 +201,115 @@ def test_implementability_penalty_decomposition_is_additive() -> None:
     )
 
 
+@pytest.mark.parametrize("seed_from_idealized", [False, True])
+def test_implementability_analysis_seeds_constrained_cycles_only_on_request(
+    monkeypatch, seed_from_idealized
+) -> None:
+    """Anchored and rate-limited cycles start cold unless seeding is requested."""
+    import examples.current_main_joint_optimizer_comparison as joint_comparison
+
+    idealized_trajectory = np.full((2, 7), 1.0)
+    seeds = []
+    solvers = []
+
+    def fake_run_pyomo_dae(a1, kc, *, initialize=None, solver, **_options) -> SolverRun:
+        seeds.append(initialize)
+        solvers.append(solver)
+        return _joint_solver_run(
+            idealized_trajectory if initialize is None else np.zeros((2, 7)), 10.0
+        )
+
+    monkeypatch.setattr(joint_comparison, "run_pyomo_dae", fake_run_pyomo_dae)
+    solver = object()
+    run_implementability_analysis(
+        16.0,
+        2.75e-4,
+        point_budget=25,
+        ncp=3,
+        solver=solver,
+        seed_from_idealized=seed_from_idealized,
+    )
+
+    expected_seed = idealized_trajectory if seed_from_idealized else None
+    assert seeds[0] is None
+    assert len(seeds) == 4
+    assert all(seed is expected_seed for seed in seeds[1:])
+    assert all(used is solver for used in solvers)
+
+
+@pytest.mark.parametrize("seed_from_neighbours", [False, True])
+def test_slew_rate_sweep_seeds_from_ascending_neighbours_only_on_request(
+    monkeypatch, seed_from_neighbours
+) -> None:
+    """Seeded sweeps solve rates in ascending order from the next-lower neighbour."""
+    pytest.importorskip("pyomo.environ")
+    import examples.current_main_joint_optimizer_comparison as joint_comparison
+
+    trajectories = {}
+    seeds = {}
+    solvers = set()
+
+    def fake_run_pyomo_dae(
+        a1,
+        kc,
+        *,
+        pressure_ramp_rate,
+        shelf_temperature_ramp_rate,
+        initialize=None,
+        solver,
+        **_options,
+    ) -> SolverRun:
+        key = (pressure_ramp_rate, shelf_temperature_ramp_rate)
+        seeds[key] = initialize
+        solvers.add(id(solver))
+        trajectories[key] = np.full((2, 7), float(len(trajectories)))
+        return _joint_solver_run(trajectories[key], 11.0)
+
+    monkeypatch.setattr(joint_comparison, "run_pyomo_dae", fake_run_pyomo_dae)
+    rows = run_slew_rate_sweep(
+        16.0,
+        2.75e-4,
+        10.0,
+        pressure_ramp_rates_torr_hr=[0.1, 0.05],
+        shelf_temperature_ramp_rates_c_hr=[60.0, 10.0, 30.0],
+        point_budget=25,
+        ncp=3,
+        seed_from_neighbours=seed_from_neighbours,
+    )
+
+    solved_pairs = [
+        (row["pressure_ramp_rate_torr_hr"], row["shelf_temperature_ramp_rate_c_hr"])
+        for row in rows
+    ]
+    # A solver name is resolved to one object shared by every grid point.
+    assert len(solvers) == 1
+    if not seed_from_neighbours:
+        assert solved_pairs == [
+            (0.1, 60.0),
+            (0.1, 10.0),
+            (0.1, 30.0),
+            (0.05, 60.0),
+            (0.05, 10.0),
+            (0.05, 30.0),
+        ]
+        assert all(seed is None for seed in seeds.values())
+        return
+    assert solved_pairs == [
+        (0.05, 10.0),
+        (0.05, 30.0),
+        (0.05, 60.0),
+        (0.1, 10.0),
+        (0.1, 30.0),
+        (0.1, 60.0),
+    ]
+    assert seeds[(0.05, 10.0)] is None
+    assert seeds[(0.05, 30.0)] is trajectories[(0.05, 10.0)]
+    assert seeds[(0.05, 60.0)] is trajectories[(0.05, 30.0)]
+    assert seeds[(0.1, 10.0)] is trajectories[(0.05, 10.0)]
+    assert seeds[(0.1, 30.0)] is trajectories[(0.1, 10.0)]
+    assert seeds[(0.1, 60.0)] is trajectories[(0.1, 30.0)]
+
+
 @pytest.mark.parametrize(
     ("pressure_rates", "shelf_rates", "message"),
     [
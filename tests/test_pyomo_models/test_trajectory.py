@@ -125,7 +125,11 @@ def test_warmstart_from_scipy_output_converts_legacy_units(standard_trajectory_c
     np.testing.assert_allclose(
         initialization["Psub"], functions.Vapor_pressure(np.array([-30, -25, -20]))
     )
-    assert "Kv" in initialization
+    ht = standard_trajectory_case["ht"]
+    np.testing.assert_allclose(
+        initialization["Kv"],
+        [functions.Kv_FUN(ht["KC"], ht["KP"], ht["KD"], pch) for pch in (0.15, 0.175, 0.2)],
+    )
 
 
 def test_apply_trajectory_warmstart_sets_indexed_variable_values(standard_trajectory_case):